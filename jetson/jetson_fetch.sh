@@ -291,6 +291,8 @@ main() {
     local iteration=0
     local errors=0
     local max_consecutive_errors=5
+    local next_run=$SECONDS
+    local remaining
     
     while true; do
         iteration=$((iteration + 1))
@@ -318,7 +320,17 @@ main() {
             info "Still running... ($iteration cycles completed)"
         fi
         
-        sleep "$SCRAPE_INTERVAL"
+        # Sleep until the next scheduled tick instead of a fixed interval,
+        # so collection and push time do not stretch the period
+        next_run=$((next_run + SCRAPE_INTERVAL))
+        remaining=$((next_run - SECONDS))
+        if [[ $remaining -gt 0 ]]; then
+            sleep "$remaining"
+        else
+            # Overran the interval - start a fresh schedule rather than
+            # firing back-to-back cycles to catch up
+            next_run=$SECONDS
+        fi
     done
 }
 
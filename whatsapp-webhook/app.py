@@ -5,10 +5,16 @@ One alert → one Telegram message → correct template
 """
 
 import os
+import asyncio
 import logging
-import requests
-from flask import Flask, request, jsonify
+import httpx
+import orjson
+import uvicorn
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from datetime import datetime
+from functools import lru_cache
 from typing import Dict
 
 # ---------------- LOGGING ----------------
@@ -18,8 +24,6 @@ logging.basicConfig(
 )
 logger = logging.getLogger("telegram-webhook")
 
-app = Flask(__name__)
-
 # ---------------- CONFIG ----------------
 TELEGRAM_ENABLED = os.getenv("TELEGRAM_ENABLED", "true").lower() == "true"
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
@@ -31,9 +35,25 @@ TELEGRAM_CHAT_IDS = [
 
 SEND_RESOLVED = os.getenv("SEND_RESOLVED_ALERTS", "false").lower() == "true"
 
+TELEGRAM_API = "https://api.telegram.org"
+TELEGRAM_SEND_PATH = f"/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+
+
+# ---------------- APP ----------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # One client per worker; HTTP/2 multiplexes every sendMessage of a
+    # fan-out over a single connection to api.telegram.org
+    app.state.client = httpx.AsyncClient(
+        base_url=TELEGRAM_API,
+        http2=True,
+        timeout=10
+    )
+    yield
+    await app.state.client.aclose()
 
-def telegram_url() -> str:
-    return f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
+
+app = FastAPI(lifespan=lifespan, default_response_class=ORJSONResponse)
 
 
 # ---------------- TEMPLATES ----------------
@@ -90,41 +110,49 @@ TEMPLATES = {
 
 
 # ---------------- HELPERS ----------------
+@lru_cache(maxsize=1024)
 def format_time(ts: str) -> str:
+    if not ts:
+        return ts
     try:
         return datetime.fromisoformat(ts.replace("Z", "+00:00")).strftime(
             "%Y-%m-%d %H:%M:%S UTC"
         )
-    except Exception:
+    except ValueError:
         return ts
 
 
-def send_telegram(text: str) -> None:
+async def send_to_chat(client: httpx.AsyncClient, chat_id: str, text: str) -> None:
+    await client.post(
+        TELEGRAM_SEND_PATH,
+        json={
+            "chat_id": chat_id,
+            "text": text,
+            "parse_mode": "Markdown"
+        }
+    )
+
+
+async def send_telegram(client: httpx.AsyncClient, text: str) -> None:
     if not TELEGRAM_ENABLED or not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_IDS:
         logger.error("Telegram not configured correctly")
         return
 
-    for chat_id in TELEGRAM_CHAT_IDS:
-        requests.post(
-            telegram_url(),
-            json={
-                "chat_id": chat_id,
-                "text": text,
-                "parse_mode": "Markdown"
-            },
-            timeout=10
-        )
+    # Send to all chats concurrently: N recipients cost max(RTT), not sum(RTT)
+    await asyncio.gather(
+        *(send_to_chat(client, chat_id, text) for chat_id in TELEGRAM_CHAT_IDS)
+    )
 
 
 # ---------------- ROUTES ----------------
-@app.route("/health", methods=["GET"])
-def health():
-    return jsonify({"status": "ok"}), 200
+@app.get("/health")
+async def health():
+    return {"status": "ok"}
 
 
-@app.route("/webhook", methods=["POST"])
-def webhook():
-    data = request.get_json()
+@app.post("/webhook")
+async def webhook(request: Request):
+    data = orjson.loads(await request.body())
     alerts = data.get("alerts", [])
 
     logger.info("Received %d alert(s)", len(alerts))
@@ -144,20 +172,27 @@ def webhook():
             logger.warning("No template for alert: %s", alert_name)
             continue
 
-        message = template.format(
-            instance=labels.get("instance", "unknown"),
-            severity=labels.get("severity", "unknown").upper(),
-            value=annotations.get("value", "N/A"),
-            description=annotations.get("description", "No description"),
-            time=format_time(alert.get("startsAt", "")),
-            status=alert_status.upper()
-        )
+        message = template.format_map({
+            "instance": labels.get("instance", "unknown"),
+            "severity": labels.get("severity", "unknown").upper(),
+            "value": annotations.get("value", "N/A"),
+            "description": annotations.get("description", "No description"),
+            "time": format_time(alert.get("startsAt", "")),
+            "status": alert_status.upper()
+        })
 
-        send_telegram(message)
+        await send_telegram(request.app.state.client, message)
         logger.info("Sent alert: %s", alert_name)
 
-    return jsonify({"status": "processed"}), 200
+    return {"status": "processed"}
 
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5000)
+    uvicorn.run(
+        app,
+        host="0.0.0.0",
+        port=5000,
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
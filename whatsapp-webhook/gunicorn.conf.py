@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for the Telegram webhook
+Each worker is a uvicorn event loop with its own pooled httpx client
+"""
+
+import os
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Async workers: every worker can hold many deliveries in flight,
+# so a small fixed count is enough for Alertmanager traffic
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = int(os.getenv("WEB_CONCURRENCY", "2"))
+
+timeout = 30
+keepalive = 30